@@ -16,7 +16,7 @@ from typing import Match, Optional
 
 import aiohue
 from aiohttp.client import ClientSession
-from pydantic import ValidationError, parse_obj_as
+from pydantic import ValidationError
 
 from hue2mqtt import __version__
 from hue2mqtt.messages import BridgeInfo, Hue2MQTTStatus
@@ -146,15 +146,19 @@ class Hue2MQTT:
 
     def publish_light(self, light: LightInfo) -> None:
         """Publish information about a light to MQTT."""
-        self._mqtt.publish(f"light/{light.uniqueid}", light, retain=True)
+        self._mqtt.publish(f"light/{light.uniqueid}", light.mqtt_payload(), retain=True)
 
     def publish_group(self, group: GroupInfo) -> None:
         """Publish information about a group to MQTT."""
-        self._mqtt.publish(f"group/{group.id}", group, retain=True)
+        self._mqtt.publish(f"group/{group.id}", group.mqtt_payload(), retain=True)
 
     def publish_sensor(self, sensor: SensorInfo) -> None:
         """Publish information about a group to MQTT."""
-        self._mqtt.publish(f"sensor/{sensor.uniqueid}", sensor, retain=True)
+        self._mqtt.publish(
+            f"sensor/{sensor.uniqueid}",
+            sensor.mqtt_payload(),
+            retain=True,
+        )
 
     async def handle_set_light(self, match: Match[str], payload: str) -> None:
         """Handle an update to a light."""
@@ -165,7 +169,7 @@ class Hue2MQTT:
             light = self._bridge.lights[light_id]
             if light.uniqueid == uniqueid:
                 try:
-                    state = parse_obj_as(LightSetState, json.loads(payload))
+                    state = LightSetState.parse_obj(json.loads(payload))
                     LOGGER.info(f"Updating {light.name}")
                     await light.set_state(**state.dict())
                 except json.JSONDecodeError:
@@ -183,7 +187,7 @@ class Hue2MQTT:
 
         try:
             group = self._bridge.groups[groupid]
-            state = parse_obj_as(GroupSetState, json.loads(payload))
+            state = GroupSetState.parse_obj(json.loads(payload))
             LOGGER.info(f"Updating group {group.name}")
             await group.set_action(**state.dict())
         except IndexError:
@@ -199,18 +203,18 @@ class Hue2MQTT:
         """Main method of the data component."""
         # Publish initial info about lights
         for idx, light_raw in self._bridge.lights._items.items():
-            light = LightInfo(id=idx, **light_raw.raw)
+            light = LightInfo.from_bridge(light_raw.raw, id=idx)
             self.publish_light(light)
 
         # Publish initial info about groups
         for idx, group_raw in self._bridge.groups._items.items():
-            group = GroupInfo(id=idx, **group_raw.raw)
+            group = GroupInfo.from_bridge(group_raw.raw, id=idx)
             self.publish_group(group)
 
         # Publish initial info about sensors
         for idx, sensor_raw in self._bridge.sensors._items.items():
             if "uniqueid" in sensor_raw.raw and "productname" in sensor_raw.raw:
-                sensor = SensorInfo(id=idx, **sensor_raw.raw)
+                sensor = SensorInfo.from_bridge(sensor_raw.raw, id=idx)
                 self.publish_sensor(sensor)
             else:
                 LOGGER.debug(f"Ignoring virtual sensor: {sensor_raw.name}")
@@ -219,13 +223,22 @@ class Hue2MQTT:
         try:
             async for updated_object in self._bridge.listen_events():
                 if isinstance(updated_object, aiohue.groups.Group):
-                    group = GroupInfo(id=updated_object.id, **updated_object.raw)
+                    group = GroupInfo.from_bridge(
+                        updated_object.raw,
+                        id=updated_object.id,
+                    )
                     self.publish_group(group)
                 elif isinstance(updated_object, aiohue.lights.Light):
-                    light = LightInfo(id=updated_object.id, **updated_object.raw)
+                    light = LightInfo.from_bridge(
+                        updated_object.raw,
+                        id=updated_object.id,
+                    )
                     self.publish_light(light)
                 elif isinstance(updated_object, aiohue.sensors.GenericSensor):
-                    sensor = SensorInfo(id=updated_object.id, **updated_object.raw)
+                    sensor = SensorInfo.from_bridge(
+                        updated_object.raw,
+                        id=updated_object.id,
+                    )
                     self.publish_sensor(sensor)
                 else:
                     LOGGER.warning("Unknown object")
@@ -4,6 +4,7 @@ MQTT Topic Abstraction.
 Allows topic strings to be constructed, along with regex to match them.
 """
 
+from functools import cached_property
 from re import compile
 from typing import Dict, Match, Optional, Pattern, Sequence
 
@@ -69,6 +70,18 @@ class Topic:
         return all(x not in self.parts for x in self.WILDCARDS)
 
     @property
+    def static_parts(self) -> Sequence[str]:
+        """
+        The parts of the topic before the first wildcard.
+
+        Any topic matched by this topic must begin with these parts.
+        """
+        for i, p in enumerate(self.parts):
+            if p in self.WILDCARDS:
+                return self.parts[:i]
+        return self.parts
+
+    @cached_property
     def regex(self) -> Pattern[str]:
         """
         Regular expression to match the topic.
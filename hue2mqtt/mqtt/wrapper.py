@@ -2,10 +2,25 @@
 
 import asyncio
 import logging
-from typing import Any, Callable, Coroutine, Dict, List, Match, Optional
+from functools import lru_cache
+from typing import (
+    Any,
+    Callable,
+    Coroutine,
+    Dict,
+    Iterator,
+    List,
+    Match,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
 
 import gmqtt
+import orjson
 from pydantic import BaseModel
+from pydantic.json import pydantic_encoder
 
 from hue2mqtt.config import MQTTBrokerInfo
 
@@ -14,6 +29,81 @@ from .topic import Topic
 LOGGER = logging.getLogger(__name__)
 
 Handler = Callable[[Match[str], str], Coroutine[Any, Any, None]]
+Payload = Union[BaseModel, Dict[str, Any]]
+
+
+class HandlerTrie:
+    """
+    Topic handlers, indexed by the static parts of their topics.
+
+    Allows the handlers that could match a topic to be found without
+    trying every subscribed topic against it.
+    """
+
+    __slots__ = ("children", "handlers")
+
+    def __init__(self) -> None:
+        self.children: Dict[str, HandlerTrie] = {}
+        self.handlers: Dict[Topic, Handler] = {}
+
+    def insert(self, topic: Topic, handler: Handler) -> None:
+        """Add a handler for a topic, replacing any existing one."""
+        node = self
+        for part in topic.static_parts:
+            node = node.children.setdefault(part, HandlerTrie())
+        node.handlers[topic] = handler
+
+    def candidates(self, parts: Sequence[str]) -> Iterator[Tuple[Topic, Handler]]:
+        """Get the handlers whose topics could match the given topic parts."""
+        node = self
+        yield from node.handlers.items()
+        for part in parts:
+            child = node.children.get(part)
+            if child is None:
+                return
+            node = child
+            yield from node.handlers.items()
+
+    def items(self) -> Iterator[Tuple[Topic, Handler]]:
+        """Get all of the topics and their handlers."""
+        yield from self.handlers.items()
+        for child in self.children.values():
+            yield from child.items()
+
+
+@lru_cache(maxsize=1024)
+def _complete_topic(prefix: str, topic: str, *, auto_prefix_topic: bool) -> bytes:
+    """
+    Get the complete topic to publish a message to, encoded for the wire.
+
+    The topic is only parsed, checked and encoded the first time that it
+    is used.
+
+    Raises a ValueError if the topic cannot be published to.
+    """
+    if len(topic) == 0:
+        topic_complete = Topic.parse(prefix)
+    elif auto_prefix_topic:
+        topic_complete = Topic.parse(f"{prefix}/{topic}")
+    else:
+        topic_complete = Topic.parse(topic)
+
+    if not topic_complete.is_publishable:
+        raise ValueError(f"Cannot publish to MQTT topic: {topic_complete}")
+
+    return str(topic_complete).encode()
+
+
+def _dump_payload(payload: Payload) -> bytes:
+    """
+    Serialise a payload to JSON for publishing.
+
+    Models are serialised by alias and excluding None. Dictionaries are
+    assumed to be in that form already.
+    """
+    if isinstance(payload, BaseModel):
+        payload = payload.dict(by_alias=True, exclude_none=True)
+    return orjson.dumps(payload, default=pydantic_encoder)
 
 
 class MQTTWrapper:
@@ -25,6 +115,17 @@ class MQTTWrapper:
     likely to go wrong.
     """
 
+    __slots__ = (
+        "_broker_info",
+        "_client",
+        "_client_name",
+        "_handler_trie",
+        "_last_will",
+        "_last_will_message",
+        "_loop",
+        "_prefix",
+    )
+
     _client: gmqtt.Client
 
     def __init__(
@@ -36,13 +137,22 @@ class MQTTWrapper:
     ) -> None:
         self._client_name = client_name
         self._broker_info = broker_info
+        self._prefix = broker_info.topic_prefix
         self._last_will = last_will
+        self._last_will_message: Optional[gmqtt.Message] = None
+        if last_will is not None:
+            self._last_will_message = gmqtt.Message(
+                self._prefix + "/" + "status",
+                orjson.dumps(last_will.dict(), default=pydantic_encoder),
+                retain=True,
+            )
 
-        self._topic_handlers: Dict[Topic, Handler] = {}
+        self._handler_trie = HandlerTrie()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
 
         self._client = gmqtt.Client(
             self._client_name,
-            will_message=self.last_will_message,
+            will_message=self._last_will_message,
         )
 
         self._client.reconnect_retries = 0
@@ -58,24 +168,18 @@ class MQTTWrapper:
     @property
     def last_will_message(self) -> Optional[gmqtt.Message]:
         """Last will and testament message for this client."""
-        if self._last_will is not None:
-            return gmqtt.Message(
-                self.mqtt_prefix + "/" + "status",
-                self._last_will.json(),
-                retain=True,
-            )
-        else:
-            return None
+        return self._last_will_message
 
     @property
     def mqtt_prefix(self) -> str:
         """The topic prefix for MQTT."""
-        return self._broker_info.topic_prefix
+        return self._prefix
 
     async def connect(self) -> None:
         """Connect to the broker."""
         if self.is_connected:
             LOGGER.error("Attempting connection, but client is already connected.")
+        self._loop = asyncio.get_running_loop()
         mqtt_version = gmqtt.constants.MQTTv50
         if self._broker_info.force_protocol_version_3_1:
             mqtt_version = gmqtt.constants.MQTTv311
@@ -114,7 +218,7 @@ class MQTTWrapper:
         properties: Dict[str, List[int]],
     ) -> None:
         """Callback for mqtt connection."""
-        for topic in self._topic_handlers:
+        for topic, _ in self._handler_trie.items():
             LOGGER.debug(f"Subscribing to {topic}")
             client.subscribe(str(topic))
 
@@ -128,18 +232,22 @@ class MQTTWrapper:
     ) -> gmqtt.constants.PubRecReasonCode:
         """Callback for mqtt messages."""
         LOGGER.debug(f"Message received on {topic} with payload: {payload!r}")
-        for t, handler in self._topic_handlers.items():
+        loop = self._loop or asyncio.get_running_loop()
+        decoded: Optional[str] = None
+        for t, handler in self._handler_trie.candidates(topic.split("/")):
             match = t.match(topic)
             if match:
                 LOGGER.debug(f"Calling {handler.__name__} to handle {topic}")
-                asyncio.ensure_future(handler(match, payload.decode()))
+                if decoded is None:
+                    decoded = payload.decode()
+                loop.create_task(handler(match, decoded))
 
         return gmqtt.constants.PubRecReasonCode.SUCCESS
 
     def publish(
         self,
         topic: str,
-        payload: BaseModel,
+        payload: Payload,
         *,
         retain: bool = False,
         auto_prefix_topic: bool = True,
@@ -150,21 +258,15 @@ class MQTTWrapper:
                 "Attempted to publish message, but client is not connected.",
             )
 
-        prefix = self._broker_info.topic_prefix
-
-        if len(topic) == 0:
-            topic_complete = Topic.parse(prefix)
-        elif auto_prefix_topic:
-            topic_complete = Topic.parse(f"{prefix}/{topic}")
-        else:
-            topic_complete = Topic.parse(topic)
-
-        if not topic_complete.is_publishable:
-            raise ValueError(f"Cannot publish to MQTT topic: {topic_complete}")
+        topic_complete = _complete_topic(
+            self._prefix,
+            topic,
+            auto_prefix_topic=auto_prefix_topic,
+        )
 
         self._client.publish(
-            str(topic_complete),
-            payload.json(by_alias=True, exclude_none=True),
+            topic_complete,
+            _dump_payload(payload),
             qos=1,
             retain=retain,
         )
@@ -182,8 +284,8 @@ class MQTTWrapper:
         Should be called before the MQTT wrapper is connected.
         """
         if len(topic) == 0:
-            topic_complete = Topic.parse(self.mqtt_prefix)
+            topic_complete = Topic.parse(self._prefix)
         else:
-            topic_complete = Topic.parse(f"{self._broker_info.topic_prefix}/{topic}")
+            topic_complete = Topic.parse(f"{self._prefix}/{topic}")
 
-        self._topic_handlers[topic_complete] = callback
+        self._handler_trie.insert(topic_complete, callback)
@@ -0,0 +1,38 @@
+"""Schemas for data about Hue."""
+
+from .bridge import BridgeModel
+from .group import GroupInfo, GroupSetState, GroupState
+from .light import LightBaseState, LightInfo, LightSetState, LightState
+from .sensor import (
+    GenericSensorState,
+    HumiditySensorState,
+    LightLevelSensorState,
+    OpenCloseSensorState,
+    PresenceSensorState,
+    RotarySensorState,
+    SensorInfo,
+    SensorState,
+    SwitchSensorState,
+    TemperatureSensorState,
+)
+
+__all__ = [
+    "BridgeModel",
+    "GenericSensorState",
+    "GroupInfo",
+    "GroupSetState",
+    "GroupState",
+    "HumiditySensorState",
+    "LightBaseState",
+    "LightInfo",
+    "LightLevelSensorState",
+    "LightSetState",
+    "LightState",
+    "OpenCloseSensorState",
+    "PresenceSensorState",
+    "RotarySensorState",
+    "SensorInfo",
+    "SensorState",
+    "SwitchSensorState",
+    "TemperatureSensorState",
+]
@@ -0,0 +1,178 @@
+"""Construction of schemas from trusted Hue Bridge data."""
+from functools import lru_cache, partial
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Mapping,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+    TypeVar,
+)
+
+from pydantic import BaseModel, PrivateAttr, ValidationError
+from pydantic.error_wrappers import ErrorWrapper
+from pydantic.errors import MissingError, NoneIsNotAllowedError, TupleLengthError
+from pydantic.fields import SHAPE_LIST, SHAPE_SINGLETON, SHAPE_TUPLE, ModelField
+
+ModelT = TypeVar("ModelT", bound=BaseModel)
+BridgeT = TypeVar("BridgeT", bound="BridgeModel")
+Factory = Callable[[Any], Any]
+
+# Types that the bridge may send in another form, e.g "3" for 3, which are
+# coerced as pydantic would. Other values, including bools, are kept as sent.
+SCALAR_TYPES = (float, int, str)
+
+
+def _scalar_list(type_: Factory) -> Factory:
+    return lambda value: [type_(v) for v in value]
+
+
+def _scalar_tuple(types: Sequence[Factory]) -> Factory:
+    def factory(value: Sequence[Any]) -> Tuple[Any, ...]:
+        if len(value) != len(types):
+            raise TupleLengthError(actual_length=len(value), expected_length=len(types))
+        return tuple(t(v) for t, v in zip(types, value))
+
+    return factory
+
+
+def _bridge_factory(field: ModelField) -> Optional[Factory]:
+    """Get the callable used to convert bridge data for a field, if any."""
+    type_ = field.type_
+    if field.shape == SHAPE_SINGLETON:
+        if _is_model(field):
+            return partial(_construct, type_)
+        if type_ in SCALAR_TYPES:
+            return type_  # type: ignore[no-any-return]
+    elif field.shape == SHAPE_LIST and type_ in SCALAR_TYPES:
+        return _scalar_list(type_)
+    elif field.shape == SHAPE_TUPLE and field.sub_fields:
+        types = [f.type_ for f in field.sub_fields]
+        if all(t in SCALAR_TYPES for t in types):
+            return _scalar_tuple(types)
+    return None
+
+
+def _is_model(field: ModelField) -> bool:
+    """Determine if a field holds a single nested model."""
+    return (
+        field.shape == SHAPE_SINGLETON
+        and isinstance(field.type_, type)
+        and issubclass(field.type_, BaseModel)
+    )
+
+
+class BridgeField(NamedTuple):
+    """How to construct a model field from bridge data."""
+
+    name: str
+    alias: str
+    factory: Optional[Factory]
+    nested: bool
+    required: bool
+    allow_none: bool
+
+
+@lru_cache(maxsize=None)
+def _bridge_fields(model: Type[BaseModel]) -> Tuple[BridgeField, ...]:
+    """Get how to construct each field on a model."""
+    return tuple(
+        BridgeField(
+            name,
+            field.alias,
+            _bridge_factory(field),
+            _is_model(field),
+            bool(field.required),
+            field.allow_none,
+        )
+        for name, field in model.__fields__.items()
+    )
+
+
+def _construct(
+    model: Type[ModelT],
+    data: Mapping[str, Any],
+) -> Tuple[ModelT, Dict[str, Any]]:
+    """
+    Construct a model from trusted data without validating it.
+
+    Only known fields are kept. Numbers and strings that the bridge sends
+    in another form are coerced as validation would, and nested models
+    are constructed in the same way. Missing required fields, unexpected
+    None values and values that cannot be coerced raise a ValidationError.
+
+    Also returns the model as it would be serialised for MQTT, i.e by
+    alias and excluding None, which is collected along the way.
+    """
+    values = {}
+    payload = {}
+    errors = []
+    for name, alias, factory, nested, required, allow_none in _bridge_fields(model):
+        if alias in data:
+            value = data[alias]
+            if value is not None:
+                try:
+                    if nested:
+                        value, payload[alias] = factory(value)  # type: ignore[misc]
+                    else:
+                        if factory is not None:
+                            value = factory(value)
+                        payload[alias] = value
+                except (TypeError, ValueError) as e:
+                    errors.append(ErrorWrapper(e, loc=alias))
+            elif not allow_none:
+                errors.append(ErrorWrapper(NoneIsNotAllowedError(), loc=alias))
+            values[name] = value
+        elif required:
+            errors.append(ErrorWrapper(MissingError(), loc=alias))
+
+    if errors:
+        raise ValidationError(errors, model)
+    return model.construct(**values), payload
+
+
+class BridgeModel(BaseModel):
+    """
+    A model of data received from the Hue Bridge.
+
+    Models are immutable, so that the MQTT payload collected when they are
+    created cannot go stale.
+    """
+
+    _mqtt_payload: Optional[Dict[str, Any]] = PrivateAttr(default=None)
+
+    class Config:
+        """Pydantic config."""
+
+        allow_mutation = False
+
+    @classmethod
+    def from_bridge(
+        cls: Type[BridgeT],
+        data: Mapping[str, Any],
+        **values: Any,
+    ) -> BridgeT:
+        """
+        Create an instance from Hue Bridge data.
+
+        The bridge is trusted, so the data is not fully validated. A
+        ValidationError is still raised if required fields are missing.
+        """
+        model, payload = _construct(cls, {**data, **values})
+        model._mqtt_payload = payload
+        return model
+
+    def mqtt_payload(self) -> Dict[str, Any]:
+        """
+        Get the data to publish to MQTT for this model.
+
+        This is collected when the model is created from bridge data, so
+        that the model does not need to be serialised again.
+        """
+        if self._mqtt_payload is None:
+            return self.dict(by_alias=True, exclude_none=True)
+        return self._mqtt_payload
@@ -0,0 +1,40 @@
+"""Schemas for data about light groups."""
+from typing import List, Optional
+
+from pydantic import BaseModel, Field
+
+from .bridge import BridgeModel
+from .light import LightSetState, LightState
+
+
+class GroupSetState(LightSetState):
+    """The settable states of a group."""
+
+    scene: Optional[str]
+
+
+class GroupState(BaseModel):
+    """The state of lights in a group."""
+
+    all_on: bool
+    any_on: bool
+
+    class Config:
+        """Pydantic config."""
+
+        allow_mutation = False
+
+
+class GroupInfo(BridgeModel):
+    """Information about a light group."""
+
+    id: int  # noqa: A003
+    name: str
+    lights: List[int]
+    sensors: List[int]
+    type: str  # noqa: A003
+    state: GroupState
+
+    group_class: Optional[str] = Field(default=None, alias="class")
+
+    action: LightState
@@ -0,0 +1,60 @@
+"""Schemas for data about lights."""
+from typing import Optional, Tuple
+
+from pydantic import BaseModel
+
+from .bridge import BridgeModel
+
+
+class LightBaseState(BaseModel):
+    """The base attributes of a light state."""
+
+    on: Optional[bool]
+
+    alert: Optional[str]
+    bri: Optional[int]
+    ct: Optional[int]
+    effect: Optional[str]
+    hue: Optional[int]
+    sat: Optional[int]
+    xy: Optional[Tuple[int, int]]
+    transitiontime: Optional[str]
+
+
+class LightSetState(LightBaseState):
+    """The settable states of a light."""
+
+    bri_inc: Optional[int]
+    sat_inc: Optional[int]
+    hue_inc: Optional[int]
+    ct_inc: Optional[int]
+    xy_inc: Optional[int]
+
+
+class LightState(LightBaseState):
+    """The State of a light that we can read."""
+
+    reachable: Optional[bool]
+    color_mode: Optional[str]
+    mode: Optional[str]
+
+    class Config:
+        """Pydantic config."""
+
+        allow_mutation = False
+
+
+class LightInfo(BridgeModel):
+    """Information about a light."""
+
+    id: int  # noqa: A003
+    name: str
+    uniqueid: str
+    state: Optional[LightState]
+
+    manufacturername: str
+    modelid: str
+    productname: str
+    type: str  # noqa: A003
+
+    swversion: str
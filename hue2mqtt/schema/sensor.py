@@ -0,0 +1,92 @@
+"""Schemas for data about sensors."""
+from typing import Any, Optional
+
+from pydantic import BaseModel
+
+from .bridge import BridgeModel
+
+
+class GenericSensorState(BaseModel):
+    """Information about the state of a sensor."""
+
+    lastupdated: Optional[str] = None
+
+
+class PresenceSensorState(GenericSensorState):
+    """Information about the state of a sensor."""
+
+    presence: Optional[bool] = None
+
+
+class RotarySensorState(GenericSensorState):
+    """Information about the state of a sensor."""
+
+    rotaryevent: Optional[str] = None
+    expectedrotation: Optional[str] = None
+    expectedeventduration: Optional[str] = None
+
+
+class SwitchSensorState(GenericSensorState):
+    """Information about the state of a sensor."""
+
+    buttonevent: Optional[int] = None
+
+
+class LightLevelSensorState(GenericSensorState):
+    """Information about the state of a sensor."""
+
+    dark: Optional[bool] = None
+    daylight: Optional[bool] = None
+    lightlevel: Optional[int] = None
+
+
+class TemperatureSensorState(GenericSensorState):
+    """Information about the state of a sensor."""
+
+    temperature: Optional[int] = None
+
+
+class HumiditySensorState(GenericSensorState):
+    """Information about the state of a sensor."""
+
+    humidity: Optional[int] = None
+
+
+class OpenCloseSensorState(GenericSensorState):
+    """Information about the state of a sensor."""
+
+    open: Optional[str] = None  # noqa: A003
+
+
+class SensorState(
+    LightLevelSensorState,
+    PresenceSensorState,
+    RotarySensorState,
+    SwitchSensorState,
+    TemperatureSensorState,
+    HumiditySensorState,
+    OpenCloseSensorState,
+):
+    """Information about the state of any kind of sensor."""
+
+    class Config:
+        """Pydantic config."""
+
+        allow_mutation = False
+
+
+class SensorInfo(BridgeModel):
+    """Information about a sensor."""
+
+    id: int  # noqa: A003
+    name: str
+    type: str  # noqa: A003
+    modelid: str
+    manufacturername: str
+
+    productname: str
+    uniqueid: str
+    swversion: Optional[str]
+
+    state: SensorState
+    capabilities: Any
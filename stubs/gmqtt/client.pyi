@@ -14,6 +14,10 @@ from typing import (
 from .constants import PubRecReasonCode
 
 class Message:
+
+    topic: bytes
+    payload: bytes
+
     def __init__(
         self,
         topic: Union[str, bytes],
@@ -94,6 +94,17 @@ def test_topic_is_publishable() -> None:
         assert not t.is_publishable
 
 
+def test_topic_static_parts() -> None:
+    """Test the static_parts property."""
+    for parts, _ in BASIC_TOPICS:
+        t = Topic(parts)
+        assert t.static_parts == parts
+
+    assert Topic(["foo", "#"]).static_parts == ["foo"]
+    assert Topic(["superfoo", "+", "uberbar"]).static_parts == ["superfoo"]
+    assert Topic(["+", "bar"]).static_parts == []
+
+
 def test_topic_regex() -> None:
     """Test the regex property."""
     for parts, topic in BASIC_TOPICS:
@@ -1,7 +1,7 @@
 """Test the MQTT Wrapper class."""
 
 import asyncio
-from typing import Match
+from typing import Any, Dict, List, Match
 
 import gmqtt
 import pytest
@@ -9,7 +9,7 @@ from pydantic import BaseModel
 
 from hue2mqtt.config import MQTTBrokerInfo
 from hue2mqtt.mqtt.topic import Topic
-from hue2mqtt.mqtt.wrapper import MQTTWrapper
+from hue2mqtt.mqtt.wrapper import MQTTWrapper, _complete_topic, _dump_payload
 
 BROKER_INFO = MQTTBrokerInfo(
     host="localhost",
@@ -38,7 +38,7 @@ def test_wrapper_init_minimal() -> None:
     assert wr._client_name == "foo"
     assert wr._last_will is None
 
-    assert len(wr._topic_handlers) == 0
+    assert len(list(wr._handler_trie.items())) == 0
 
     assert wr._client._client_id == "foo"
 
@@ -55,6 +55,16 @@ def test_wrapper_last_will_message_null() -> None:
     assert wr.last_will_message is None
 
 
+def test_wrapper_last_will_message() -> None:
+    """Test that the last will message is serialised to JSON."""
+    wr = MQTTWrapper("foo", BROKER_INFO, last_will=StubModel(foo="bar"))
+    message = wr.last_will_message
+    assert message is not None
+    assert message.topic == b"hue2mqtt/status"
+    assert message.payload == b'{"foo":"bar"}'
+    assert wr.last_will_message is message
+
+
 def test_wrapper_mqtt_prefix() -> None:
     """Test that the MQTT prefix is as expected."""
     wr = MQTTWrapper("foo", BROKER_INFO)
@@ -65,11 +75,112 @@ def test_subscribe() -> None:
     """Test that subscribing works as expected."""
     wr = MQTTWrapper("foo", BROKER_INFO)
 
-    assert len(wr._topic_handlers) == 0
+    assert len(list(wr._handler_trie.items())) == 0
+
+    wr.subscribe("bees/+", stub_message_handler)
+    handlers = dict(wr._handler_trie.items())
+    assert len(handlers) == 1
+    assert handlers[Topic(["hue2mqtt", "bees", "+"])] == stub_message_handler
+
+    # Subscribing again to the same topic replaces the handler.
+    wr.subscribe("bees/+", stub_message_handler)
+    assert len(list(wr._handler_trie.items())) == 1
+
+
+def test_on_connect_subscribes() -> None:
+    """Test that all subscribed topics are subscribed to on connection."""
+    subscribed = []
+
+    class StubClient:
+        def subscribe(self, topic: str) -> None:
+            subscribed.append(topic)
+
+    wr = MQTTWrapper("foo", BROKER_INFO)
+    wr.subscribe("bees/+", stub_message_handler)
+    wr.subscribe("bees/hive/#", stub_message_handler)
+    wr.subscribe("", stub_message_handler)
+
+    wr.on_connect(StubClient(), 0, 0, {})  # type: ignore[arg-type]
+    assert sorted(subscribed) == ["hue2mqtt", "hue2mqtt/bees/+", "hue2mqtt/bees/hive/#"]
+
+
+def test_subscribe_handler_trie() -> None:
+    """Test that only handlers for possibly matching topics are candidates."""
+    wr = MQTTWrapper("foo", BROKER_INFO)
 
     wr.subscribe("bees/+", stub_message_handler)
-    assert len(wr._topic_handlers) == 1
-    assert wr._topic_handlers[Topic(["hue2mqtt", "bees", "+"])] == stub_message_handler
+    wr.subscribe("bees/hive/#", stub_message_handler)
+    wr.subscribe("wasps/+", stub_message_handler)
+    wr.subscribe("", stub_message_handler)
+
+    def candidates(topic: str) -> List[str]:
+        return sorted(str(t) for t, _ in wr._handler_trie.candidates(topic.split("/")))
+
+    assert candidates("hue2mqtt/bees/hive/queen") == [
+        "hue2mqtt",
+        "hue2mqtt/bees/+",
+        "hue2mqtt/bees/hive/#",
+    ]
+    assert candidates("hue2mqtt/wasps/nest") == ["hue2mqtt", "hue2mqtt/wasps/+"]
+    assert candidates("other/bees/hive") == []
+
+
+@pytest.mark.asyncio
+async def test_on_message_decodes_only_on_match() -> None:
+    """Test that payloads are decoded and handled only for matching topics."""
+    ev = asyncio.Event()
+
+    async def test_handler(
+        match: Match[str],
+        payload: str,
+    ) -> None:
+        assert match.group(1) == "bar"
+        ev.set()
+
+    wr = MQTTWrapper("foo", BROKER_INFO)
+    wr.subscribe("bees/+", test_handler)
+    wr.subscribe("wasps/+", stub_message_handler)
+
+    # Manually call on_message, without connecting
+    # The payload is only decoded once a handler matches.
+    await wr.on_message(wr._client, "hue2mqtt/bees/bar/baz", b"\xff", 0, {})
+    await wr.on_message(wr._client, "hue2mqtt/hive/bar", b"\xff", 0, {})
+    await wr.on_message(wr._client, "hue2mqtt/bees/bar", b"hive", 0, {})
+
+    await asyncio.wait_for(ev.wait(), 0.1)
+
+
+def test_complete_topic() -> None:
+    """Test that complete topics are built and cached."""
+    topic = _complete_topic("hue2mqtt", "bees/foo", auto_prefix_topic=True)
+    assert topic == b"hue2mqtt/bees/foo"
+    assert _complete_topic("hue2mqtt", "bees/foo", auto_prefix_topic=True) is topic
+
+    assert _complete_topic("hue2mqtt", "", auto_prefix_topic=True) == b"hue2mqtt"
+    topic = _complete_topic("hue2mqtt", "bees/foo", auto_prefix_topic=False)
+    assert topic == b"bees/foo"
+
+    with pytest.raises(ValueError):
+        _complete_topic("hue2mqtt", "bees/+", auto_prefix_topic=True)
+
+    with pytest.raises(ValueError):
+        _complete_topic("hue2mqtt", "bees/", auto_prefix_topic=True)
+
+
+def test_dump_payload() -> None:
+    """Test that models and dictionaries are serialised to JSON."""
+    assert _dump_payload(StubModel(foo="bar")) == b'{"foo":"bar"}'
+    assert _dump_payload({"foo": "bar", "bees": [1, 2]}) == b'{"foo":"bar","bees":[1,2]}'
+
+
+def test_dump_payload_dict_override() -> None:
+    """Test that a model's own dict method is used to serialise it."""
+
+    class OverrideModel(StubModel):
+        def dict(self, **kwargs: Any) -> Dict[str, Any]:  # noqa: A003
+            return {"bees": super().dict(**kwargs)}
+
+    assert _dump_payload(OverrideModel(foo="bar")) == b'{"bees":{"foo":"bar"}}'
 
 
 @pytest.mark.filterwarnings("ignore")
@@ -12,3 +12,11 @@ def test_valid_config() -> None:
     with DATA_DIR.joinpath("valid.toml").open("rb") as fh:
         config = Hue2MQTTConfig.load_from_file(fh)
     assert config is not None
+
+
+def test_load() -> None:
+    """Test that we can load a valid config from a path."""
+    path = str(DATA_DIR.joinpath("valid.toml"))
+    config = Hue2MQTTConfig.load(path)
+    assert config == Hue2MQTTConfig.load(path)
+    assert config is not Hue2MQTTConfig.load(path)
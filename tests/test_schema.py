@@ -0,0 +1,155 @@
+"""Test the schemas for data from the Hue Bridge."""
+
+from typing import Any, Dict
+
+import pytest
+from pydantic import ValidationError
+
+from hue2mqtt.schema import GroupInfo, LightInfo, SensorInfo
+
+LIGHT_RAW: Dict[str, Any] = {
+    "state": {
+        "on": False,
+        "bri": 153,
+        "ct": 497,
+        "alert": "none",
+        "colormode": "ct",
+        "xy": [0.5, 0.4],
+        "reachable": True,
+        "mode": "homeautomation",
+    },
+    "swupdate": {"state": "noupdates", "lastinstall": "2021-07-10T11:37:58"},
+    "type": "Extended color light",
+    "name": "Lounge Lamp",
+    "modelid": "LCT012",
+    "manufacturername": "Signify Netherlands B.V.",
+    "productname": "Hue color candle",
+    "uniqueid": "00:17:88:01:ab:cd:ef:01-02",
+    "swversion": "1.50.2_r30933",
+}
+
+GROUP_RAW: Dict[str, Any] = {
+    "name": "Lounge",
+    "lights": ["24", "21", "3"],
+    "sensors": [],
+    "type": "Room",
+    "state": {"all_on": False, "any_on": True},
+    "recycle": False,
+    "class": "Living room",
+    "action": {"on": True, "bri": 153, "alert": "select"},
+}
+
+SENSOR_RAW: Dict[str, Any] = {
+    "state": {"buttonevent": 4002, "lastupdated": "2021-07-10T11:37:58"},
+    "config": {"on": True, "battery": 100},
+    "name": "Lounge switch",
+    "type": "ZLLSwitch",
+    "modelid": "RWL021",
+    "manufacturername": "Signify Netherlands B.V.",
+    "productname": "Hue dimmer switch",
+    "swversion": "6.1.1.28573",
+    "uniqueid": "00:17:88:01:ab:cd:ef:01-02",
+    "capabilities": {"certified": True, "primary": True},
+}
+
+
+def test_light_from_bridge() -> None:
+    """Test that a light from the bridge matches the validated model."""
+    light = LightInfo.from_bridge(LIGHT_RAW, id="1")
+    assert light == LightInfo(id=1, **LIGHT_RAW)
+    assert light.id == 1
+    assert light.state is not None
+    assert light.state.xy == (0, 0)
+    assert light.mqtt_payload() == light.dict(by_alias=True, exclude_none=True)
+
+
+def test_group_from_bridge() -> None:
+    """Test that a group from the bridge matches the validated model."""
+    group = GroupInfo.from_bridge(GROUP_RAW, id="3")
+    assert group == GroupInfo(id=3, **GROUP_RAW)
+    assert group.lights == [24, 21, 3]
+    assert group.group_class == "Living room"
+    assert group.mqtt_payload() == group.dict(by_alias=True, exclude_none=True)
+    assert group.json(by_alias=True, exclude_none=True) == GroupInfo(
+        id=3,
+        **GROUP_RAW,
+    ).json(by_alias=True, exclude_none=True)
+
+
+def test_sensor_from_bridge() -> None:
+    """Test that a sensor from the bridge matches the validated model."""
+    sensor = SensorInfo.from_bridge(SENSOR_RAW, id="10")
+    assert sensor == SensorInfo(id=10, **SENSOR_RAW)
+    assert sensor.id == 10
+    assert sensor.mqtt_payload() == sensor.dict(by_alias=True, exclude_none=True)
+
+
+def test_mqtt_payload_validated() -> None:
+    """Test that a validated model can also provide an MQTT payload."""
+    sensor = SensorInfo(id=10, **SENSOR_RAW)
+    assert sensor.mqtt_payload() == sensor.dict(by_alias=True, exclude_none=True)
+
+
+def test_from_bridge_immutable() -> None:
+    """Test that bridge models cannot be changed after their payload is collected."""
+    light = LightInfo.from_bridge(LIGHT_RAW, id="1")
+    with pytest.raises(TypeError):
+        light.name = "Kitchen Lamp"
+    assert light.state is not None
+    with pytest.raises(TypeError):
+        light.state.on = True
+    assert light.mqtt_payload()["name"] == "Lounge Lamp"
+    assert light.mqtt_payload()["state"]["on"] is False
+
+
+def test_from_bridge_missing_required() -> None:
+    """Test that bridge data missing a required field is rejected."""
+    light_raw = {k: v for k, v in LIGHT_RAW.items() if k != "swversion"}
+    with pytest.raises(ValidationError):
+        LightInfo(id=1, **light_raw)
+    with pytest.raises(ValidationError):
+        LightInfo.from_bridge(light_raw, id="1")
+
+    group_raw = {**GROUP_RAW, "state": {"all_on": False}}
+    with pytest.raises(ValidationError):
+        GroupInfo(id=3, **group_raw)
+    with pytest.raises(ValidationError):
+        GroupInfo.from_bridge(group_raw, id="3")
+
+
+def test_from_bridge_bad_value() -> None:
+    """Test that values that cannot be coerced are rejected."""
+    light_raw = {**LIGHT_RAW, "state": {**LIGHT_RAW["state"], "bri": "abc"}}
+    with pytest.raises(ValidationError):
+        LightInfo(id=1, **light_raw)
+    with pytest.raises(ValidationError):
+        LightInfo.from_bridge(light_raw, id="1")
+
+    with pytest.raises(ValidationError):
+        LightInfo.from_bridge(LIGHT_RAW, id="bees")
+
+
+def test_from_bridge_bad_tuple_length() -> None:
+    """Test that tuples of the wrong length are rejected."""
+    light_raw = {**LIGHT_RAW, "state": {**LIGHT_RAW["state"], "xy": [0.5]}}
+    with pytest.raises(ValidationError):
+        LightInfo(id=1, **light_raw)
+    with pytest.raises(ValidationError):
+        LightInfo.from_bridge(light_raw, id="1")
+
+
+def test_from_bridge_bool() -> None:
+    """Test that bools from the bridge are kept as sent."""
+    light = LightInfo.from_bridge(LIGHT_RAW, id="1")
+    assert light.state is not None
+    assert light.state.on is False
+    assert light.state.reachable is True
+
+
+def test_from_bridge_required_none() -> None:
+    """Test that None for a required field is rejected."""
+    light_raw = {**LIGHT_RAW, "swversion": None}
+    with pytest.raises(ValidationError):
+        LightInfo(id=1, **light_raw)
+    with pytest.raises(ValidationError):
+        LightInfo.from_bridge(light_raw, id="1")